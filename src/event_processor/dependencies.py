@@ -1,7 +1,11 @@
 """Dependency injection and management facilities."""
 import inspect
+import types
 import typing
-from typing import Callable, Any, Optional, Dict, Tuple, List, Type
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Any, Optional, Dict, Sequence, Tuple, List, Type
+from weakref import WeakKeyDictionary
 
 from .exceptions import DependencyError
 
@@ -39,6 +43,8 @@ def Depends(callable_: Callable[..., DependsReturn], cache: bool = True) -> Depe
 class _Depends:
     """Class to designate a dependency"""
 
+    __slots__ = ("callable", "cache", "_hash")
+
     def __init__(self, callable_: Callable[..., DependsReturn], cache: bool = True):
         """Create a dependency.
 
@@ -47,18 +53,190 @@ class _Depends:
         """
         self.callable = callable_
         self.cache = cache
+        # Dependencies are used as cache keys on every resolution, so the hash is computed at most once.
+        # It stays lazy because unhashable callables are fine as long as nothing ever hashes them (e.g. a
+        # directly-registered processor with caching disabled).
+        self._hash: Optional[int] = None
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            if self.callable is other.callable and self.cache is other.cache:
-                return True
+            if self._hash is not None and other._hash is not None and self._hash != other._hash:
+                return False
+            return self.callable is other.callable and self.cache is other.cache
         return False
 
     def __ne__(self, other):
         return not (self == other)
 
     def __hash__(self):
-        return hash((self.callable, self.cache))
+        if self._hash is None:
+            self._hash = hash((self.callable, self.cache))
+        return self._hash
+
+
+_signature_cache: "WeakKeyDictionary[Callable, inspect.Signature]" = WeakKeyDictionary()
+
+
+def _signature(callable_: Callable) -> inspect.Signature:
+    """Get the signature of a callable, introspecting it at most once.
+
+    The cache holds only weak references so that long-running processes which create many short-lived callables
+    do not pin them in memory. Callables that cannot be weakly referenced fall back to a strong cache, which is
+    safe because such objects are typically module-lifetime anyway.
+
+    :param callable_: The callable for which to get the signature
+    :return: The signature of the callable
+    """
+    try:
+        signature = _signature_cache.get(callable_)
+        if signature is None:
+            signature = _introspect_signature(callable_)
+            _signature_cache[callable_] = signature
+        return signature
+    except TypeError:
+        try:
+            return _signature_strongly_cached(callable_)
+        except TypeError:
+            # Unhashable callables cannot be cached at all.
+            return _introspect_signature(callable_)
+
+
+@lru_cache(maxsize=None)
+def _signature_strongly_cached(callable_: Callable) -> inspect.Signature:
+    """Get the signature of a callable that cannot be weakly referenced."""
+    return _introspect_signature(callable_)
+
+
+def _introspect_signature(callable_: Callable) -> inspect.Signature:
+    """Build the signature of a callable, reading plain functions directly from their code object.
+
+    ``inspect.signature`` unwraps decorators, follows ``__signature__`` and handles every callable shape, which
+    makes it expensive. Processors and dependencies are almost always plain functions, and for those the same
+    information is available directly on the function object at a fraction of the cost. Anything else (classes,
+    methods, partials, mocks, decorated functions) falls through to ``inspect.signature``.
+
+    :param callable_: The callable for which to build the signature
+    :return: The signature of the callable
+    """
+    if (
+        type(callable_) is not types.FunctionType
+        or hasattr(callable_, "__signature__")
+        or hasattr(callable_, "__wrapped__")
+    ):
+        return inspect.signature(callable_)
+
+    code = callable_.__code__
+    positional_only_count = getattr(code, "co_posonlyargcount", 0)
+    arg_count = code.co_argcount
+    keyword_only_count = code.co_kwonlyargcount
+    names = code.co_varnames
+    defaults = callable_.__defaults__ or ()
+    keyword_defaults = callable_.__kwdefaults__ or {}
+    annotations = callable_.__annotations__
+    empty = inspect.Parameter.empty
+
+    parameters = []
+    first_default = arg_count - len(defaults)
+    for index in range(arg_count):
+        name = names[index]
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_ONLY
+                if index < positional_only_count
+                else inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=defaults[index - first_default] if index >= first_default else empty,
+                annotation=annotations.get(name, empty),
+            )
+        )
+
+    # In co_varnames, the *args and **kwargs names come after the keyword-only ones.
+    var_index = arg_count + keyword_only_count
+    if code.co_flags & inspect.CO_VARARGS:
+        name = names[var_index]
+        var_index += 1
+        parameters.append(
+            inspect.Parameter(name, inspect.Parameter.VAR_POSITIONAL, annotation=annotations.get(name, empty))
+        )
+    for index in range(arg_count, arg_count + keyword_only_count):
+        name = names[index]
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=keyword_defaults.get(name, empty),
+                annotation=annotations.get(name, empty),
+            )
+        )
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        name = names[var_index]
+        parameters.append(
+            inspect.Parameter(name, inspect.Parameter.VAR_KEYWORD, annotation=annotations.get(name, empty))
+        )
+
+    return inspect.Signature(parameters, return_annotation=annotations.get("return", empty))
+
+
+@dataclass(frozen=True)
+class InjectionPlan:
+    """The injectable parameters of a callable, computed once from its signature."""
+
+    event_params: Tuple[str, ...]
+    pydantic_params: Tuple[Tuple[str, Type["BaseModel"], Callable[[Any], "BaseModel"]], ...]
+    depends_params: Tuple[Tuple[str, _Depends], ...]
+    scalar_params: Tuple[inspect.Parameter, ...]
+    is_trivial: bool
+
+
+def get_injection_plan(callable_: Callable) -> InjectionPlan:
+    """Get the injection plan for a callable.
+
+    Plans are cached, so repeated resolutions of the same callable do not pay for introspection. Unhashable
+    callables cannot be cached and have their plan rebuilt on each call.
+
+    :param callable_: The callable for which to build a plan
+    :return: The injection plan for the callable
+    """
+    try:
+        return _cached_injection_plan(callable_)
+    except TypeError:
+        return _build_injection_plan(callable_)
+
+
+@lru_cache(maxsize=None)
+def _cached_injection_plan(callable_: Callable) -> InjectionPlan:
+    """Get the injection plan for a hashable callable, building it at most once."""
+    return _build_injection_plan(callable_)
+
+
+def _build_injection_plan(callable_: Callable) -> InjectionPlan:
+    """Build the injection plan for a callable.
+
+    The signature is walked a single time. A parameter with a dependency default takes precedence over its
+    annotation, which mirrors the order in which values are injected.
+
+    :param callable_: The callable for which to build a plan
+    :return: The injection plan for the callable
+    """
+    event_params = []
+    pydantic_params = []
+    depends_params = []
+    scalar_params = []
+    for name, param in _signature(callable_).parameters.items():
+        if isinstance(param.default, _Depends):
+            depends_params.append((name, param.default))
+        elif param.annotation is Event:
+            event_params.append(name)
+        elif _has_pydantic and inspect.isclass(param.annotation) and issubclass(param.annotation, BaseModel):
+            # The parse function is bound here so resolution does not pay an attribute lookup per event.
+            pydantic_params.append((name, param.annotation, param.annotation.parse_obj))
+        elif param.kind not in {param.VAR_POSITIONAL, param.VAR_KEYWORD}:
+            scalar_params.append(param)
+
+    is_trivial = not (event_params or pydantic_params or depends_params or scalar_params)
+    return InjectionPlan(
+        tuple(event_params), tuple(pydantic_params), tuple(depends_params), tuple(scalar_params), is_trivial
+    )
 
 
 def call_with_injection(
@@ -78,6 +256,42 @@ def call_with_injection(
     return value
 
 
+class _ResolutionFrame:
+    """A single dependency being resolved on the iterative resolution stack."""
+
+    def __init__(
+        self,
+        dependency: _Depends,
+        event: Optional[Event],
+        model_cache: Dict[type, Any],
+        parent_arg: Optional[str] = None,
+    ):
+        self.dependency = dependency
+        self.plan = get_injection_plan(dependency.callable)
+        self.parent_arg = parent_arg
+        self.next_dependency = 0
+        self.cacheable = dependency.cache
+        self.resolved: Dict[str, Any] = {}
+        for arg_name in self.plan.event_params:
+            self.resolved[arg_name] = event
+        for arg_name, model, parser in self.plan.pydantic_params:
+            parsed = model_cache.get(model)
+            if parsed is None:
+                parsed = model_cache[model] = parser(event)
+            self.resolved[arg_name] = parsed
+
+    def finish(self, event: Optional[Event], cache: Optional[dict]) -> Any:
+        """Resolve the remaining scalar dependencies, call the callable and cache its value if appropriate."""
+        self.resolved.update(resolve_scalar_value_dependencies(self.plan.scalar_params, event=event))
+
+        value = self.dependency.callable(**self.resolved)
+
+        if cache is not None and self.cacheable:
+            cache[self.dependency] = value
+
+        return value
+
+
 def resolve(
     dependency: _Depends, event: Optional[Event] = None, cache: Optional[dict] = None
 ) -> Tuple[Optional[Any], bool]:
@@ -88,81 +302,96 @@ def resolve(
     dependency where caching has been disabled will also not be cached (because the sub-value may change, which may in
     turn change the value of the current dependency).
 
+    The dependency graph is walked iteratively with an explicit stack, so deep graphs do not pay for one Python
+    call frame per dependency and cannot hit the interpreter's recursion limit.
+
     :param dependency: The dependency to resolve
     :param event: The event for the current invocation
     :param cache: The cache for previously resolved dependencies
     :return: The tuple (resolved_value, cacheable)
+    :raises: DependencyError if the dependency graph contains a cycle
     :raises: pydantic.error_wrappers.ValidationError if the event cannot be parsed into a pydantic model
     """
     if cache and dependency in cache:
         return cache[dependency], True
-    cacheable = dependency.cache
-
-    resolved_dependencies: Dict[str, Any] = {}
-    for arg_name in get_event_dependencies(dependency.callable):
-        resolved_dependencies[arg_name] = event
-
-    for arg_name, model in get_pydantic_dependencies(dependency.callable).items():
-        resolved_dependencies[arg_name] = model.parse_obj(event)
-
-    for arg_name, required_dependency in get_required_dependencies(dependency.callable).items():
-        resolved_dependencies[arg_name], cacheable_dep = resolve(required_dependency, event=event, cache=cache)
-        cacheable = cacheable and cacheable_dep
-
-    scalar_dependencies = [
-        dependency
-        for dependency in get_scalar_value_dependencies(dependency.callable)
-        if dependency.name not in resolved_dependencies
-    ]
-    resolved_scalar_dependencies = resolve_scalar_value_dependencies(scalar_dependencies, event=event)
-    resolved_dependencies.update(resolved_scalar_dependencies)
-
-    value = dependency.callable(**resolved_dependencies)
 
-    if cache is not None and cacheable:
-        cache[dependency] = value
+    if get_injection_plan(dependency.callable).is_trivial:
+        # Callables taking no injectable parameters at all skip the frame and scalar-resolution machinery.
+        value = dependency.callable()
+        if cache is not None and dependency.cache:
+            cache[dependency] = value
+        return value, dependency.cache
+
+    # The event is constant for the duration of a resolution, so a pydantic model shared by several dependencies
+    # only needs to be parsed once per invocation.
+    model_cache: Dict[type, Any] = {}
+    root = _ResolutionFrame(dependency, event, model_cache)
+    if not root.plan.depends_params:
+        # Callables without sub-dependencies (the common case for processors) resolve in a straight line
+        # without paying for the stack bookkeeping below.
+        return root.finish(event, cache), root.cacheable
+
+    stack = [root]
+    while True:
+        frame = stack[-1]
+        depends_params = frame.plan.depends_params
+        if frame.next_dependency < len(depends_params):
+            arg_name, sub_dependency = depends_params[frame.next_dependency]
+            frame.next_dependency += 1
+            if cache and sub_dependency in cache:
+                frame.resolved[arg_name] = cache[sub_dependency]
+            elif any(sub_dependency.callable is ancestor.dependency.callable for ancestor in stack):
+                raise DependencyError(f"Circular dependency detected for '{sub_dependency.callable}'")
+            else:
+                stack.append(_ResolutionFrame(sub_dependency, event, model_cache, parent_arg=arg_name))
+            continue
 
-    return value, cacheable
+        value = frame.finish(event, cache)
+        stack.pop()
+        if not stack:
+            return value, frame.cacheable
+        # Only the root frame has no parent_arg, and it is always the last one popped.
+        assert frame.parent_arg is not None
+        parent = stack[-1]
+        parent.resolved[frame.parent_arg] = value
+        parent.cacheable = parent.cacheable and frame.cacheable
 
 
 def get_required_dependencies(callable_: Callable) -> Dict[str, _Depends]:
     """Get the required dependencies for a callable.
 
+    The expensive signature introspection is cached in the injection plan; the returned mapping is built fresh
+    on every call, so callers are free to mutate it.
+
     :param callable_: The callable for which to get dependencies
     :return: A mapping of callable argument names to dependencies
     """
-    signature = inspect.signature(callable_)
-    required_dependencies = {
-        name: arg.default
-        for name, arg in signature.parameters.items()
-        if arg.default is not inspect.Parameter.empty and isinstance(arg.default, _Depends)
-    }
-    return required_dependencies
+    return dict(get_injection_plan(callable_).depends_params)
 
 
 def get_event_dependencies(callable_: Callable) -> List[str]:
     """Get the parameter names for event dependencies.
 
+    The expensive signature introspection is cached in the injection plan; the returned list is built fresh
+    on every call, so callers are free to mutate it.
+
     :param callable_: The callable for which to get dependencies
     :return: A list of the parameters requiring the event
     """
-    signature = inspect.signature(callable_)
-    return [name for name, arg in signature.parameters.items() if arg.annotation is Event]
+    return list(get_injection_plan(callable_).event_params)
 
 
 def get_pydantic_dependencies(callable_: Callable) -> Dict[str, Type["BaseModel"]]:
     """Get the required models and their parameter names for a callable.
 
+    The expensive signature introspection is cached in the injection plan; the returned mapping is built fresh
+    on every call, so callers are free to mutate it.
+
     :param callable_: The callable for which to get dependencies
     :return: A mapping of argument names to pydantic model types
     """
     if _has_pydantic:
-        signature = inspect.signature(callable_)
-        return {
-            name: arg.annotation
-            for name, arg in signature.parameters.items()
-            if inspect.isclass(arg.annotation) and issubclass(arg.annotation, BaseModel)
-        }
+        return {name: model for name, model, _parser in get_injection_plan(callable_).pydantic_params}
     else:
         return {}
 
@@ -170,17 +399,20 @@ def get_pydantic_dependencies(callable_: Callable) -> Dict[str, Type["BaseModel"
 def get_scalar_value_dependencies(callable_: Callable) -> List[inspect.Parameter]:
     """Get the scalar value dependencies for a callable.
 
+    The expensive signature introspection is cached; the returned list is built fresh on every call, so
+    callers are free to mutate it.
+
     :param callable_: The callable for which to get dependencies
     :return: A view of the parameters that represent dependencies
     """
-    signature = inspect.signature(callable_)
+    signature = _signature(callable_)
     return [
         param for param in signature.parameters.values() if param.kind not in {param.VAR_POSITIONAL, param.VAR_KEYWORD}
     ]
 
 
 def resolve_scalar_value_dependencies(
-    scalar_dependencies: List[inspect.Parameter], event: Optional[Event]
+    scalar_dependencies: Sequence[inspect.Parameter], event: Optional[Event]
 ) -> Dict[str, Any]:
     """Resolve the scalar dependencies to values contained in the event.
 
@@ -191,7 +423,7 @@ def resolve_scalar_value_dependencies(
     :return: A new dict with resolved dependency values
     """
     if event is None:
-        event = Event({})
+        event = _EMPTY_EVENT
 
     if _has_pydantic:
         return resolve_scalar_value_dependencies_with_pydantic(scalar_dependencies, event)
@@ -200,7 +432,7 @@ def resolve_scalar_value_dependencies(
 
 
 def resolve_scalar_value_dependencies_without_pydantic(
-    scalar_dependencies: List[inspect.Parameter], event: Event
+    scalar_dependencies: Sequence[inspect.Parameter], event: Event
 ) -> Dict[str, Any]:
     """Resolve the scalar dependencies to values contained in the event without using pydantic.
 
@@ -212,28 +444,92 @@ def resolve_scalar_value_dependencies_without_pydantic(
     :param event: The event from which to get values
     :return: A new dict with resolved dependency values
     """
-    resolved = {}
-    for param in scalar_dependencies:
-        try:
-            resolved[param.name] = event[param.name]
-        except KeyError:
-            raise DependencyError(f"No value found in event for param '{param.name}'")
+    try:
+        return {param.name: event[param.name] for param in scalar_dependencies}
+    except KeyError as missing:
+        raise DependencyError(f"No value found in event for param '{missing.args[0]}'")
+
+
+_scalar_model_cache: Dict[Tuple, Tuple[Type["BaseModel"], bool]] = {}
 
-    return resolved
+# Shared stand-in for invocations without an event; it is only ever read from, never mutated.
+_EMPTY_EVENT = Event({})
 
 
 def resolve_scalar_value_dependencies_with_pydantic(
-    scalar_dependencies: List[inspect.Parameter], event: Event
+    scalar_dependencies: Sequence[inspect.Parameter], event: Event
 ) -> Dict[str, Any]:
     """Resolve the scalar dependencies to values contained in the event with pydantic.
 
     This function does validation for the types of values passed into the event. Since this uses
     pydantic, it's possible to use any pydantic types such as PaymentCardNumber, for example.
 
+    The constructed model only depends on the parameters, so it is cached and re-used across invocations
+    (building a pydantic model is far more expensive than validating with it). Parameters with unhashable
+    annotations or defaults cannot be used as a cache key, so those fall back to building the model each time.
+    When no parameter declares an annotation or a default, the model cannot validate, coerce or fill in
+    anything, so the values are taken straight from the event instead of going through pydantic at all.
+
     :param scalar_dependencies: The dependencies to resolve
     :param event: The event from which to get values
     :return: A new dict with resolved and validated dependency values
     """
+    try:
+        pydantic_model, passthrough = _scalar_model_entry(scalar_dependencies)
+    except TypeError:
+        pydantic_model, passthrough = _build_scalar_model(scalar_dependencies), False
+
+    if passthrough:
+        try:
+            return {param.name: event[param.name] for param in scalar_dependencies}
+        except KeyError:
+            pass  # Run the model anyway so a missing value raises the usual validation error.
+
+    filled_model = pydantic_model(**event)
+
+    return filled_model.dict()
+
+
+def _scalar_model_entry(scalar_dependencies: Sequence[inspect.Parameter]) -> Tuple[Type["BaseModel"], bool]:
+    """Get the cached model and passthrough flag for the given parameters, building them on a miss.
+
+    :param scalar_dependencies: The dependencies for which to get a model
+    :return: The tuple (pydantic_model, passthrough)
+    :raises: TypeError when a parameter is unhashable and cannot form a cache key
+    """
+    # The default's type is part of the key because equal defaults of different types (True == 1 == 1.0)
+    # would otherwise share a model and inject the wrong default.
+    cache_key = tuple(
+        (param.name, param.annotation, type(param.default), param.default) for param in scalar_dependencies
+    )
+    entry = _scalar_model_cache.get(cache_key)
+    if entry is None:
+        entry = _scalar_model_cache[cache_key] = (
+            _build_scalar_model(scalar_dependencies),
+            _scalar_model_is_passthrough(scalar_dependencies),
+        )
+    return entry
+
+
+def _scalar_model_is_passthrough(scalar_dependencies: Sequence[inspect.Parameter]) -> bool:
+    """Tell whether a scalar model would pass every value through unchanged.
+
+    :param scalar_dependencies: The dependencies the model was built for
+    :return: True when no parameter has an annotation or a default
+    """
+    empty = inspect.Parameter.empty
+    return all(
+        (param.annotation is empty or param.annotation is Any) and param.default is empty
+        for param in scalar_dependencies
+    )
+
+
+def _build_scalar_model(scalar_dependencies: Sequence[inspect.Parameter]) -> Type["BaseModel"]:
+    """Build a pydantic model with one field per scalar dependency.
+
+    :param scalar_dependencies: The dependencies for which to build a model
+    :return: The pydantic model class
+    """
     model_params = {}
     for param in scalar_dependencies:
         param_type = Any if param.annotation is inspect.Parameter.empty else param.annotation
@@ -247,7 +543,32 @@ def resolve_scalar_value_dependencies_with_pydantic(
 
         model_params[param.name] = (param_type, param_default)
 
-    pydantic_model = create_model("ScalarDependencies", **model_params)  # type: ignore
-    filled_model = pydantic_model(**event)
+    return create_model("ScalarDependencies", **model_params)  # type: ignore
 
-    return filled_model.dict()
+
+def warm_dependency_caches(callable_: Callable) -> None:
+    """Populate the per-callable caches ahead of the first invocation.
+
+    Building injection plans and scalar pydantic models is the expensive part of handling a first event, so
+    doing it at registration moves that cost to import time. Warming is best-effort: anything that fails here
+    is simply skipped and will surface its original error on the first invocation instead.
+
+    :param callable_: The callable whose caches should be warmed
+    """
+    seen: set = set()
+    stack = [callable_]
+    while stack:
+        current = stack.pop()
+        try:
+            if current in seen:
+                continue
+            seen.add(current)
+            plan = get_injection_plan(current)
+        except Exception:
+            continue
+        if _has_pydantic and plan.scalar_params:
+            try:
+                _scalar_model_entry(plan.scalar_params)
+            except Exception:
+                pass
+        stack.extend(sub_dependency.callable for _name, sub_dependency in plan.depends_params)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Type, Callable
+from typing import Any, Type, Callable
 
 from .result import Result
 
@@ -8,12 +8,16 @@ from .result import Result
 class ErrorHandlingStrategy(ABC):
     """Defines the interface of an error handling strategy."""
 
+    __slots__ = ()
+
     @abstractmethod
-    def invoke(self, callable_name: str, callable_: Callable) -> Result:
+    def invoke(self, callable_name: str, callable_: Callable, *args: Any, **kwargs: Any) -> Result:
         """Invoke the callable with the error handling strategy.
 
         :param callable_name: The name of the callable to invoke
         :param callable_: The callable to invoke
+        :param args: The positional arguments to call the callable with
+        :param kwargs: The keyword arguments to call the callable with
         :return: A Result containing the result or error
         :raises: Potentially any exception coming from a processor
         """
@@ -22,37 +26,44 @@ class ErrorHandlingStrategy(ABC):
 class Bubble(ErrorHandlingStrategy):
     """Strategy to let errors bubble up to the invoker."""
 
-    def invoke(self, callable_name: str, callable_: Callable) -> Result:
+    __slots__ = ()
+
+    def invoke(self, callable_name: str, callable_: Callable, *args: Any, **kwargs: Any) -> Result:
         """Invoke the bubble error handling strategy.
 
         :param callable_name: The name of the callable to execute
         :param callable_: The callable to execute
+        :param args: The positional arguments to call the callable with
+        :param kwargs: The keyword arguments to call the callable with
         :return: A Result containing the callable's return value if there was no exception
         :raises: Any exception that was raised in the callable
         """
-        return Result(processor_name=callable_name, returned_value=callable_())
+        return Result(processor_name=callable_name, returned_value=callable_(*args, **kwargs))
 
 
 class SpecificBubble(ErrorHandlingStrategy):
     """Strategy to let specific errors bubble up to the invoker."""
 
+    __slots__ = ("bubble_errors",)
+
     def __init__(self, *bubble_errors: Type[Exception]):
         self.bubble_errors = bubble_errors
 
-    def invoke(self, callable_name: str, callable_: Callable) -> Result:
+    def invoke(self, callable_name: str, callable_: Callable, *args: Any, **kwargs: Any) -> Result:
         """Invoke the specific bubble error handling strategy.
 
         :param callable_name: The name of the callable to execute
         :param callable_: The callable to execute
+        :param args: The positional arguments to call the callable with
+        :param kwargs: The keyword arguments to call the callable with
         :return: A Result containing the callable's return value or an exception that should not be bubbled
         :raises: Any exception that was passed in the constructor to be bubbled
         """
         try:
-            return Result(processor_name=callable_name, returned_value=callable_())
+            return Result(processor_name=callable_name, returned_value=callable_(*args, **kwargs))
         except Exception as e:
-            for to_bubble in self.bubble_errors:
-                if isinstance(e, to_bubble):
-                    raise e
+            if isinstance(e, self.bubble_errors):
+                raise e
 
             return Result(processor_name=callable_name, raised_exception=e)
 
@@ -60,15 +71,19 @@ class SpecificBubble(ErrorHandlingStrategy):
 class Capture(ErrorHandlingStrategy):
     """Strategy to capture errors and add them to the returned result."""
 
-    def invoke(self, callable_name: str, callable_: Callable) -> Result:
+    __slots__ = ()
+
+    def invoke(self, callable_name: str, callable_: Callable, *args: Any, **kwargs: Any) -> Result:
         """Invoke the capture error handling strategy.
 
         :param callable_name: The name of the callable to execute
         :param callable_: The callable to execute
+        :param args: The positional arguments to call the callable with
+        :param kwargs: The keyword arguments to call the callable with
         :return: A Result containing the callable's return value or an exception that was raised by the callable
         """
         try:
-            return Result(processor_name=callable_name, returned_value=callable_())
+            return Result(processor_name=callable_name, returned_value=callable_(*args, **kwargs))
         except Exception as e:
             return Result(processor_name=callable_name, raised_exception=e)
 
@@ -76,23 +91,26 @@ class Capture(ErrorHandlingStrategy):
 class SpecificCapture(ErrorHandlingStrategy):
     """Strategy to capture specific errors only."""
 
+    __slots__ = ("capture_errors",)
+
     def __init__(self, *capture_errors: Type[Exception]):
         self.capture_errors = capture_errors
 
-    def invoke(self, callable_name: str, callable_: Callable) -> Result:
+    def invoke(self, callable_name: str, callable_: Callable, *args: Any, **kwargs: Any) -> Result:
         """Invoke the specific capture error handling strategy.
 
         :param callable_name: The name of the callable to execute
         :param callable_: The callable to execute
+        :param args: The positional arguments to call the callable with
+        :param kwargs: The keyword arguments to call the callable with
         :return: A Result containing the callable's return value or an exception that should be captured
         :raises: Any exception that was not explicitly captured
         """
         try:
-            return Result(processor_name=callable_name, returned_value=callable_())
+            return Result(processor_name=callable_name, returned_value=callable_(*args, **kwargs))
         except Exception as e:
-            for to_capture in self.capture_errors:
-                if isinstance(e, to_capture):
-                    return Result(processor_name=callable_name, raised_exception=e)
+            if isinstance(e, self.capture_errors):
+                return Result(processor_name=callable_name, raised_exception=e)
 
             raise e
 
@@ -1,27 +1,34 @@
 """Contains the EventProcessor class."""
-import inspect
 from copy import copy
 from types import ModuleType
-from typing import Dict, Callable, Tuple, List, Union
+from typing import Dict, Callable, FrozenSet, Optional, Tuple, List, Union
+from weakref import WeakKeyDictionary
 
 from .dependencies import (
-    get_required_dependencies,
-    get_event_dependencies,
+    _signature,
     Event,
-    get_pydantic_dependencies,
-    get_scalar_value_dependencies,
+    get_injection_plan,
+    warm_dependency_caches,
 )
 from .error_handling_strategies import ErrorHandlingStrategies
 from .exceptions import (
     FilterError,
     InvocationError,
 )
-from .filters import Filter
+from .filters import _matches_with_cache, Filter
 from .invocation_strategies import InvocationStrategies
 from .result import Result
 from .util import load_all_modules_in_package
 
 
+# A module's top-level EventProcessor instances never change after import, so each module is scanned at most
+# once; weak keys let the entry die with the module object.
+_module_scan_cache: "WeakKeyDictionary[ModuleType, Tuple[EventProcessor, ...]]" = WeakKeyDictionary()
+
+# Stand-in key requirement for filters that do not advertise one.
+_NO_REQUIRED_KEYS: FrozenSet[str] = frozenset()
+
+
 class EventProcessor:
     """A self-contained event processor."""
 
@@ -43,11 +50,12 @@ class EventProcessor:
         """
         modules_in_package = load_all_modules_in_package(package)
         for module in modules_in_package:
-            module_contents = dir(module)
-            for item_name in module_contents:
-                item = getattr(module, item_name)
-                if isinstance(item, EventProcessor):
-                    self.add_subprocessor(item)
+            subprocessors = _module_scan_cache.get(module)
+            if subprocessors is None:
+                subprocessors = tuple(_find_subprocessors_in_module(module))
+                _module_scan_cache[module] = subprocessors
+            for subprocessor in subprocessors:
+                self.add_subprocessor(subprocessor)
 
     def add_subprocessors(self, *subprocessors: "EventProcessor"):
         """Add multiple subprocessors at once.
@@ -96,6 +104,10 @@ class EventProcessor:
             else:
                 self.processors[filter_with_rank] = [fn]
 
+            # Registration happens at import time, so warming the caches here keeps the cost of building
+            # injection plans and scalar models out of the first invocation.
+            warm_dependency_caches(fn)
+
             return fn
 
         return decorate
@@ -108,14 +120,28 @@ class EventProcessor:
         :param event: The event to find a processor for
         :return: The return value of the processor
         """
-        matching, highest_rank = [], float("-inf")
-        for (filter_, rank), processors in self.processors.items():
-            if filter_.matches(event):
-                if rank > highest_rank:
-                    # We take a copy here to avoid mutating the list of processors associated with a filter if we also
-                    # end up hitting the elif just below.
+        matching: List[Callable] = []
+        highest_rank: Optional[int] = None
+        # The registry dict stays the single source of truth (callers may mutate it), so the rank ordering is
+        # established per invocation. Walking ranks in descending order means no filter below the winning rank
+        # is ever evaluated, which matters when low-rank filters are expensive (e.g. Dyn resolvers).
+        event_keys = event.keys()
+        # Path lookups are memoized across all filters for the duration of this invocation, since candidate
+        # filters frequently probe the same paths.
+        path_cache: Dict = {}
+        for (filter_, rank), processors in sorted(self.processors.items(), key=_rank_of_entry, reverse=True):
+            if highest_rank is not None and rank < highest_rank:
+                break
+            # Filters advertise the top-level keys they cannot match without, so most misses are rejected
+            # with a set comparison instead of a full match. Registered objects that only implement the
+            # documented matches() interface advertise nothing and are always fully matched.
+            required_keys = getattr(filter_, "_required_keys", _NO_REQUIRED_KEYS)
+            if required_keys <= event_keys and _matches_with_cache(filter_, event, path_cache):
+                if highest_rank is None:
+                    # We take a copy here to avoid mutating the list of processors associated with a filter if we
+                    # also end up extending it just below.
                     matching, highest_rank = copy(processors), rank
-                elif rank == highest_rank:
+                else:
                     matching.extend(processors)
 
         if matching:
@@ -124,18 +150,36 @@ class EventProcessor:
             raise InvocationError(f"No matching processor for the event '{event}'")
 
 
+def _find_subprocessors_in_module(module: ModuleType) -> List[EventProcessor]:
+    """Find all EventProcessor instances defined at the top level of a module.
+
+    :param module: The module to scan
+    :return: The EventProcessor instances found in the module
+    """
+    # vars() reads the module namespace directly: unlike dir() + getattr it does not sort names, pull in
+    # inherited attributes or trigger descriptors.
+    return [item for item in vars(module).values() if isinstance(item, EventProcessor)]
+
+
+def _rank_of_entry(entry: Tuple[Tuple[Filter, int], List[Callable]]) -> int:
+    """Get the rank of a registry entry, for sorting processors by rank.
+
+    :param entry: The ((filter, rank), processors) registry item
+    :return: The rank of the entry
+    """
+    return entry[0][1]
+
+
 def processor_params_are_valid(processor: Callable) -> bool:
     """Verify that a processor's params are valid.
 
     :param processor: The processor to check
     :return: True if they are valid, False otherwise
     """
-    dependencies = get_required_dependencies(processor)
-    event_dependencies = get_event_dependencies(processor)
-    pydantic_dependencies = get_pydantic_dependencies(processor)
-    scalar_dependencies = get_scalar_value_dependencies(processor)
-
-    non_scalars = len(dependencies) + len(event_dependencies) + len(pydantic_dependencies)
-    scalars = len(scalar_dependencies) - non_scalars
+    plan = get_injection_plan(processor)
+    classified_params = (
+        len(plan.event_params) + len(plan.pydantic_params) + len(plan.depends_params) + len(plan.scalar_params)
+    )
 
-    return scalars + non_scalars == len(inspect.signature(processor).parameters)
+    # Every parameter the plan could not classify is a *args/**kwargs, which processors may not take.
+    return classified_params == len(_signature(processor).parameters)
@@ -1,15 +1,100 @@
 """Contains many different filters to conveniently filter through events."""
+import operator
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Union, Callable, Optional
+from typing import Any, FrozenSet, Union, Callable, Optional, Tuple
 
 from .dependencies import call_with_injection, Event
 from .exceptions import FilterError, NoValueError
-from .util import get_value_at_path
+from .util import get_value_at_path, get_value_at_parts
+
+
+def _split_path(path: Any) -> Optional[Tuple[str, ...]]:
+    """Split a dotted path once at construction time, or return None when the path is not a string.
+
+    Components are interned: filters on overlapping paths then share key objects, so the dict probes during
+    matching and path-cache lookups compare by identity and reuse cached string hashes.
+
+    :param path: The path to split
+    :return: The path components, or None when the path cannot be split
+    """
+    return tuple(sys.intern(part) for part in path.split(".")) if isinstance(path, str) else None
+
+
+# Cache marker for paths that were looked up and had no value.
+_NO_VALUE = object()
+# Cache marker for paths that have not been looked up yet.
+_UNCACHED = object()
+
+
+def _cached_value_at(event: dict, path: Any, parts: Optional[Tuple[str, ...]], path_cache: dict) -> Any:
+    """Look up a path in an event, memoizing hits and misses in a per-invocation cache.
+
+    Filters frequently share paths (an Exists and an Eq on the same key, or the same filter reused across
+    ranks), so within a single invocation each unique path only needs to be walked once.
+
+    :param event: The event in which to look
+    :param path: The original path
+    :param parts: The pre-split path components, if the path was a string
+    :param path_cache: The per-invocation cache of already-walked paths
+    :return: The value found at the path
+    :raises: NoValueError when no value exists at the path
+    """
+    if parts is None:
+        return get_value_at_path(event, path)
+
+    value = path_cache.get(parts, _UNCACHED)
+    if value is _UNCACHED:
+        try:
+            value = get_value_at_parts(event, parts, path)
+        except NoValueError:
+            path_cache[parts] = _NO_VALUE
+            raise
+        path_cache[parts] = value
+        return value
+    if value is _NO_VALUE:
+        raise NoValueError(f"No value at the path '{path}'")
+    return value
+
+
+def _matches_with_cache(filter_: Any, event: dict, path_cache: dict) -> bool:
+    """Match a filter, passing the shared path cache through when the filter supports it.
+
+    Objects that only implement the documented matches() interface are dispatched through it directly,
+    without the path cache.
+
+    :param filter_: The filter (or any object implementing the filter interface) to test
+    :param event: The event to test
+    :param path_cache: The cache of already-walked paths for this invocation
+    :return: True if the event matches, False otherwise
+    """
+    matcher = getattr(filter_, "_matches", None)
+    if matcher is None:
+        return filter_.matches(event)
+    return matcher(event, path_cache)
 
 
 class Filter(ABC):
     """Abstract filter to define the filter interface."""
 
+    __slots__ = ()
+
+    # Top-level event keys without which this filter cannot possibly match. Invokers may use this to skip
+    # the full match entirely; an empty set means "no cheap precondition is known".
+    _required_keys: FrozenSet[str] = frozenset()
+
+    # Whether matching this filter may add keys to the event (a Dyn with inject_as does). Composites
+    # containing such a filter cannot advertise key preconditions, since a required key could be injected
+    # mid-match.
+    _injects_keys: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass that overrides matches() without also overriding _matches() would inherit a _matches()
+        # that bypasses its override, so dispatch is routed back through matches() for it.
+        if "matches" in cls.__dict__ and "_matches" not in cls.__dict__:
+            cls._matches = Filter._matches
+
     @abstractmethod
     def matches(self, event: dict) -> bool:
         """Test whether a given event matches an input event.
@@ -18,6 +103,17 @@ class Filter(ABC):
         :return: True if the event matches, False otherwise
         """
 
+    def _matches(self, event: dict, path_cache: dict) -> bool:
+        """Test an event while sharing a per-invocation path-lookup cache.
+
+        Filters that perform no path lookups simply defer to matches().
+
+        :param event: The event to test
+        :param path_cache: The cache of already-walked paths for this invocation
+        :return: True if the event matches, False otherwise
+        """
+        return self.matches(event)
+
     @abstractmethod
     def __hash__(self):
         """Hash a filter for storage in a dict or set."""
@@ -59,6 +155,8 @@ class Filter(ABC):
 class Accept(Filter):
     """Accept any event (good for default processors)."""
 
+    __slots__ = ()
+
     def matches(self, _event: dict) -> bool:
         return True
 
@@ -72,19 +170,31 @@ class Accept(Filter):
 class Exists(Filter):
     """Accept event where a given key exists."""
 
+    __slots__ = ("path", "_parts", "_hash", "_required_keys")
+
     def __init__(self, path: Any):
         self.path = path
+        self._parts = _split_path(path)
+        self._hash: Optional[int] = None
+        self._required_keys = frozenset((self._parts[0],)) if self._parts else frozenset()
 
     def matches(self, event: dict) -> bool:
+        # Bound to this class's _matches() so that subclasses overriding matches() can call it through
+        # super() without re-entering their own override.
+        return Exists._matches(self, event, {})
+
+    def _matches(self, event: dict, path_cache: dict) -> bool:
         try:
-            get_value_at_path(event, self.path)
+            _cached_value_at(event, self.path, self._parts, path_cache)
         except NoValueError:
             return False
 
         return True
 
     def __hash__(self):
-        return hash((self.__class__, self.path))
+        if self._hash is None:
+            self._hash = hash((self.__class__, self.path))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if isinstance(other, self.__class__):
@@ -95,18 +205,30 @@ class Exists(Filter):
 class Eq(Filter):
     """Accept events where a given value is present at the given key."""
 
+    __slots__ = ("path", "value", "_parts", "_hash", "_required_keys")
+
     def __init__(self, path: Any, value: Any):
         self.path = path
         self.value = value
+        self._parts = _split_path(path)
+        self._hash: Optional[int] = None
+        self._required_keys = frozenset((self._parts[0],)) if self._parts else frozenset()
 
     def matches(self, event: dict) -> bool:
+        # Bound to this class's _matches() so that subclasses overriding matches() can call it through
+        # super() without re-entering their own override.
+        return Eq._matches(self, event, {})
+
+    def _matches(self, event: dict, path_cache: dict) -> bool:
         try:
-            return self.value == get_value_at_path(event, self.path)
+            return self.value == _cached_value_at(event, self.path, self._parts, path_cache)
         except NoValueError:
             return False
 
     def __hash__(self):
-        return hash((self.__class__, (self.path, self.value)))
+        if self._hash is None:
+            self._hash = hash((self.__class__, (self.path, self.value)))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if isinstance(other, self.__class__):
@@ -123,14 +245,24 @@ class NumCmp(Filter):
     leading to perhaps unexpected results.
     """
 
+    __slots__ = ("path", "comparator", "target", "_parts", "_hash", "_required_keys")
+
     def __init__(self, path: Any, comparator: Callable[[float, float], bool], target: float):
         self.path = path
         self.comparator = comparator
         self.target = target
+        self._parts = _split_path(path)
+        self._hash: Optional[int] = None
+        self._required_keys = frozenset((self._parts[0],)) if self._parts else frozenset()
 
     def matches(self, event: dict) -> bool:
+        # Bound to this class's _matches() so that subclasses overriding matches() can call it through
+        # super() without re-entering their own override.
+        return NumCmp._matches(self, event, {})
+
+    def _matches(self, event: dict, path_cache: dict) -> bool:
         try:
-            found_value = get_value_at_path(event, self.path)
+            found_value = _cached_value_at(event, self.path, self._parts, path_cache)
             float_value = float(found_value)
         except (NoValueError, ValueError):
             return False
@@ -138,7 +270,9 @@ class NumCmp(Filter):
         return self.comparator(float_value, self.target)
 
     def __hash__(self):
-        return hash((self.__class__, (self.path, self.comparator, self.target)))
+        if self._hash is None:
+            self._hash = hash((self.__class__, (self.path, self.comparator, self.target)))
+        return self._hash
 
     def __eq__(self, other) -> bool:
         if isinstance(other, self.__class__):
@@ -149,49 +283,41 @@ class NumCmp(Filter):
 class Lt(NumCmp):
     """Accept events where the value at the given path exists and is less than the specified value."""
 
+    __slots__ = ()
+
     def __init__(self, path: Any, value: Union[int, float]):
         float_value = float(value)
-        super().__init__(path, self._compare, float_value)
-
-    @staticmethod
-    def _compare(event_value: float, target_value: float) -> bool:
-        return event_value < target_value
+        super().__init__(path, operator.lt, float_value)
 
 
 class Leq(NumCmp):
     """Accept events where the value at the given path exists is less than or equal to the specified value."""
 
+    __slots__ = ()
+
     def __init__(self, path: Any, value: Union[int, float]):
         float_value = float(value)
-        super().__init__(path, self._compare, float_value)
-
-    @staticmethod
-    def _compare(event_value: float, target_value: float) -> bool:
-        return event_value <= target_value
+        super().__init__(path, operator.le, float_value)
 
 
 class Gt(NumCmp):
     """Accept events where the value exists and is greater than the specified value."""
 
+    __slots__ = ()
+
     def __init__(self, path: Any, value: Union[int, float]):
         float_value = float(value)
-        super().__init__(path, self._compare, float_value)
-
-    @staticmethod
-    def _compare(event_value: float, target_value: float) -> bool:
-        return event_value > target_value
+        super().__init__(path, operator.gt, float_value)
 
 
 class Geq(NumCmp):
     """Accept events where the value exists and is greater than or equal to the specified value."""
 
+    __slots__ = ()
+
     def __init__(self, path: Any, value: Union[int, float]):
         float_value = float(value)
-        super().__init__(path, self._compare, float_value)
-
-    @staticmethod
-    def _compare(event_value: float, target_value: float) -> bool:
-        return event_value >= target_value
+        super().__init__(path, operator.ge, float_value)
 
 
 class Dyn(Filter):
@@ -208,12 +334,15 @@ class Dyn(Filter):
     strategies.
     """
 
+    __slots__ = ("resolver", "inject_as", "_injects_keys")
+
     def __init__(self, resolver: Callable, inject_as: Optional[str] = None):
         if not callable(resolver):
             raise FilterError("The resolver for a dyn filter must be callable")
 
         self.resolver = resolver
         self.inject_as = inject_as
+        self._injects_keys = inject_as is not None
 
     def matches(self, event: dict) -> bool:
         if hasattr(self.resolver, "__name__") and self.resolver.__name__ == "<lambda>":
@@ -227,6 +356,14 @@ class Dyn(Filter):
 
         return matches
 
+    def _matches(self, event: dict, path_cache: dict) -> bool:
+        matched = self.matches(event)
+        if matched and self.inject_as and path_cache:
+            # Injecting a key mutates the event, so lookups cached earlier in the invocation (including
+            # cached misses for the injected path) are stale.
+            path_cache.clear()
+        return matched
+
     def __hash__(self):
         return hash(self.resolver)
 
@@ -239,16 +376,43 @@ class Dyn(Filter):
 class And(Filter):
     """Accept events that get accepted by all specified filters."""
 
+    __slots__ = ("filters", "_hash", "_required_keys", "_injects_keys")
+
     def __init__(self, *args: Filter):
         self.filters = args
+        self._hash: Optional[int] = None
+        # A conjunction needs every key any of its filters needs — unless one of them may inject keys during
+        # matching, in which case a required key could appear mid-match and no precondition is sound.
+        # Filters that do not advertise usable metadata (e.g. arbitrary objects implementing the interface)
+        # are assumed to inject.
+        try:
+            self._injects_keys = any(filter_._injects_keys for filter_ in args)
+        except AttributeError:
+            self._injects_keys = True
+        # Every child that advertises the flag is a filter that also advertises its keys; children without
+        # the flag were assumed to inject above, which skips the union entirely.
+        self._required_keys = (
+            frozenset().union(*(filter_._required_keys for filter_ in args))
+            if args and not self._injects_keys
+            else frozenset()
+        )
 
     def matches(self, event: dict) -> bool:
-        return all(filter_.matches(event) for filter_ in self.filters)
+        # Bound to this class's _matches() so that subclasses overriding matches() can call it through
+        # super() without re-entering their own override.
+        return And._matches(self, event, {})
+
+    def _matches(self, event: dict, path_cache: dict) -> bool:
+        return all(_matches_with_cache(filter_, event, path_cache) for filter_ in self.filters)
 
     def __hash__(self):
-        return hash((self.__class__, self.filters))
+        if self._hash is None:
+            self._hash = hash((self.__class__, self.filters))
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if other is self:
+            return True
         if isinstance(other, self.__class__):
             self_in_other = all(filter_ in other.filters for filter_ in self.filters)
             other_in_self = all(filter_ in self.filters for filter_ in other.filters)
@@ -259,16 +423,44 @@ class And(Filter):
 class Or(Filter):
     """Accept events that get accepted by at least one specified filter."""
 
+    __slots__ = ("filters", "_hash", "_required_keys", "_injects_keys")
+
     def __init__(self, *args: Filter):
         self.filters = args
+        self._hash: Optional[int] = None
+        # The flag only propagates here; the intersection below is already sound because any injecting child
+        # advertises an empty key set of its own. Children without usable metadata are assumed to inject.
+        try:
+            self._injects_keys = any(filter_._injects_keys for filter_ in args)
+        except AttributeError:
+            self._injects_keys = True
+        # A disjunction only needs the keys that every one of its filters needs. Filters that do not advertise
+        # a usable key set contribute no precondition.
+        try:
+            self._required_keys = (
+                frozenset.intersection(*(frozenset(filter_._required_keys) for filter_ in args))
+                if args
+                else frozenset()
+            )
+        except (AttributeError, TypeError):
+            self._required_keys = frozenset()
 
     def matches(self, event: dict) -> bool:
-        return any(filter_.matches(event) for filter_ in self.filters)
+        # Bound to this class's _matches() so that subclasses overriding matches() can call it through
+        # super() without re-entering their own override.
+        return Or._matches(self, event, {})
+
+    def _matches(self, event: dict, path_cache: dict) -> bool:
+        return any(_matches_with_cache(filter_, event, path_cache) for filter_ in self.filters)
 
     def __hash__(self):
-        return hash((self.__class__, self.filters))
+        if self._hash is None:
+            self._hash = hash((self.__class__, self.filters))
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if other is self:
+            return True
         if isinstance(other, self.__class__):
             self_in_other = all(filter_ in other.filters for filter_ in self.filters)
             other_in_self = all(filter_ in self.filters for filter_ in other.filters)
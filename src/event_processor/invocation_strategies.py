@@ -1,7 +1,7 @@
 """Contains the different invocation strategies for calling processors."""
-from functools import partial
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional, List, Callable, Any, Union
 
 from .dependencies import call_with_injection, Event
@@ -11,6 +11,19 @@ from .result import Result
 
 
 def _get_processor_name(processor: Any) -> str:
+    if processor is None:
+        return "unavailable"
+
+    try:
+        # Processors live for the lifetime of the module that defines them, so the unbounded cache is safe.
+        return _cached_processor_name(processor)
+    except TypeError:
+        # Unhashable callables cannot go through the cache, so their name is looked up directly.
+        return getattr(processor, "__name__", "unavailable")
+
+
+@lru_cache(maxsize=None)
+def _cached_processor_name(processor: Any) -> str:
     try:
         return processor.__name__
     except AttributeError:
@@ -35,11 +48,15 @@ class FirstMatch(InvocationStrategy):
 
     def invoke(self, matching: List[Callable], event: Optional[Event] = None, cache: Optional[Dict] = None) -> Result:
         return self.error_handling_strategy.invoke(
-            callable_name=_get_processor_name(matching[0]),
-            callable_=partial(call_with_injection, matching[0], event=event, cache=cache),
+            _get_processor_name(matching[0]), call_with_injection, matching[0], event=event, cache=cache
         )
 
 
+# Shared instance for the strategies that delegate single-match invocation. Delegation has always used a
+# default-constructed FirstMatch (with the default Bubble error handling), so one instance can serve them all.
+_FIRST_MATCH = FirstMatch()
+
+
 class AllMatches(InvocationStrategy):
     """Strategy calling all matching processors."""
 
@@ -50,8 +67,7 @@ class AllMatches(InvocationStrategy):
         for match in matching:
             results.append(
                 self.error_handling_strategy.invoke(
-                    callable_name=_get_processor_name(match),
-                    callable_=partial(call_with_injection, match, event=event, cache=cache),
+                    _get_processor_name(match), call_with_injection, match, event=event, cache=cache
                 )
             )
 
@@ -65,7 +81,7 @@ class NoMatches(InvocationStrategy):
         if len(matching) >= 2:
             return Result(processor_name=_get_processor_name(None), returned_value=None)
 
-        return FirstMatch().invoke(matching, event=event, cache=cache)
+        return _FIRST_MATCH.invoke(matching, event=event, cache=cache)
 
 
 class NoMatchesStrict(InvocationStrategy):
@@ -75,7 +91,7 @@ class NoMatchesStrict(InvocationStrategy):
         if len(matching) >= 2:
             raise InvocationError("Multiple matching processors of the same rank")
 
-        return FirstMatch().invoke(matching, event=event, cache=cache)
+        return _FIRST_MATCH.invoke(matching, event=event, cache=cache)
 
 
 class InvocationStrategies(Enum):
@@ -2,10 +2,13 @@ import importlib
 import typing
 from pathlib import Path
 from types import ModuleType
-from typing import Any, List
+from typing import Any, List, Sequence
 
 from .exceptions import NoValueError
 
+# Sentinel for dict.get so missing keys are detected without raising and catching KeyError.
+_MISSING = object()
+
 
 def get_value_at_path(source: dict, path: str) -> Any:
     """Get the value in a source dict at the given path.
@@ -15,12 +18,32 @@ def get_value_at_path(source: dict, path: str) -> Any:
     :return: The value found at the path
     :raises: NoValueError when no value exists at the path
     """
+    return get_value_at_parts(source, path.split("."), path)
+
+
+def get_value_at_parts(source: dict, parts: Sequence[str], path: str) -> Any:
+    """Get the value in a source dict at the given pre-split path.
+
+    Callers that hold a fixed path (like filters) can split it once and avoid re-splitting on every lookup.
+
+    :param source: The dict from which to extract the value
+    :param parts: The components of the path to look into
+    :param path: The original path, used for error reporting
+    :return: The value found at the path
+    :raises: NoValueError when no value exists at the path
+    """
     current_location = source
-    for part in path.split("."):
-        try:
-            current_location = current_location[part]
-        except (KeyError, TypeError):
-            raise NoValueError(f"No value at the path '{path}'")
+    for part in parts:
+        if isinstance(current_location, dict):
+            current_location = current_location.get(part, _MISSING)
+            if current_location is _MISSING:
+                raise NoValueError(f"No value at the path '{path}'")
+        else:
+            # Non-dict intermediate values (including None) mean the path cannot be followed further.
+            try:
+                current_location = current_location[part]
+            except (KeyError, TypeError):
+                raise NoValueError(f"No value at the path '{path}'")
 
     return current_location
 
@@ -7,8 +7,10 @@ from pydantic import BaseModel, ValidationError
 from pydantic.color import Color
 
 from src.event_processor.dependencies import (
+    _signature,
     Depends,
     resolve,
+    warm_dependency_caches,
     get_required_dependencies,
     call_with_injection,
     Event,
@@ -22,6 +24,28 @@ from src.event_processor.dependencies import (
 from src.event_processor.exceptions import DependencyError
 
 
+def test_signature_falls_back_to_a_strong_cache_for_non_weakref_callables():
+    class SlottedCallable:
+        __slots__ = ()
+
+        def __call__(self, a, b=0):
+            pass
+
+    callable_ = SlottedCallable()
+
+    signature = _signature(callable_)
+
+    assert _signature(callable_) is signature
+    assert list(signature.parameters) == ["a", "b"]
+
+
+def test_signature_matches_inspect_for_keyword_only_parameters():
+    def fn(a, *args, b, c=0, **kwargs):
+        pass
+
+    assert _signature(fn) == inspect.signature(fn)
+
+
 def test_depends_init_sets_values():
     def fn():
         pass
@@ -50,6 +74,24 @@ def test_depends_eq_compares_correctly():
     assert depends_fn != "not a depends"
 
 
+def test_depends_eq_compares_correctly_after_hashing():
+    def fn():
+        pass
+
+    def other_fn():
+        pass
+
+    depends_fn = Depends(fn)
+    depends_fn_again = Depends(fn)
+    depends_other_fn = Depends(other_fn)
+    hash(depends_fn)
+    hash(depends_fn_again)
+    hash(depends_other_fn)
+
+    assert depends_fn == depends_fn_again
+    assert depends_fn != depends_other_fn
+
+
 def test_call_with_injection_calls_callable():
     callable_mock = Mock()
 
@@ -238,6 +280,30 @@ def test_resolve_injects_required_dependencies_for_nested_dependencies():
     assert result is mock_callable.return_value
 
 
+def test_resolve_uses_cached_values_for_sub_dependencies():
+    sub_mock = Mock()
+    sub_dependency = Depends(sub_mock)
+
+    def fn(a: Mock = sub_dependency):
+        return a
+
+    cache = {sub_dependency: "cached-value"}
+    result, _ = resolve(Depends(fn, cache=False), cache=cache)
+
+    assert result == "cached-value"
+    sub_mock.assert_not_called()
+
+
+def test_resolve_raises_a_dependency_error_for_circular_dependencies():
+    def fn(value=None):
+        return value
+
+    fn.__defaults__ = (Depends(fn),)
+
+    with pytest.raises(DependencyError):
+        resolve(Depends(fn))
+
+
 def test_resolve_only_caches_values_that_require_other_cached_values():
     mock_callable = Mock()
     cached_dependency = Depends(mock_callable, cache=True)
@@ -403,6 +469,17 @@ def test_get_scalar_value_dependencies_returns_dependencies_when_they_are_specif
     assert dependencies[0].annotation == str
 
 
+def test_get_dependencies_return_fresh_containers_on_every_call():
+    def fn(_a: str, _b=Depends(lambda: None)):
+        pass
+
+    get_required_dependencies(fn).clear()
+    get_scalar_value_dependencies(fn).clear()
+
+    assert len(get_required_dependencies(fn)) == 1
+    assert len(get_scalar_value_dependencies(fn)) == 2
+
+
 def test_resolve_scalar_value_dependencies_without_pydantic_fetches_values_from_event():
     event = {"x": 0}
     scalar_dependencies = [inspect.Parameter("x", kind=inspect.Parameter.POSITIONAL_ONLY)]
@@ -487,9 +564,55 @@ def test_resolve_scalar_value_dependencies_with_pydantic_makes_values_optional_w
     assert result["x"] == "default"
 
 
+def test_resolve_scalar_value_dependencies_with_pydantic_distinguishes_equal_defaults_of_different_types():
+    int_dependencies = [inspect.Parameter("x", default=1, kind=inspect.Parameter.POSITIONAL_ONLY)]
+    bool_dependencies = [inspect.Parameter("x", default=True, kind=inspect.Parameter.POSITIONAL_ONLY)]
+
+    int_result = resolve_scalar_value_dependencies_with_pydantic(int_dependencies, Event({}))
+    bool_result = resolve_scalar_value_dependencies_with_pydantic(bool_dependencies, Event({}))
+
+    assert int_result["x"] == 1 and int_result["x"] is not True
+    assert bool_result["x"] is True
+
+
+def test_resolve_scalar_value_dependencies_with_pydantic_builds_uncached_models_for_unhashable_defaults():
+    scalar_dependencies = [inspect.Parameter("x", default=[1], kind=inspect.Parameter.POSITIONAL_ONLY)]
+
+    result = resolve_scalar_value_dependencies_with_pydantic(scalar_dependencies, Event({}))
+
+    assert result["x"] == [1]
+
+
 def test_resolve_scalar_value_dependencies_with_pydantic_passes_none_to_unfilled_optionals():
     scalar_dependencies = [inspect.Parameter("x", annotation=Optional[str], kind=inspect.Parameter.POSITIONAL_ONLY)]
 
     result = resolve_scalar_value_dependencies_with_pydantic(scalar_dependencies, Event({}))
 
     assert result["x"] is None
+
+
+def test_warm_dependency_caches_skips_callables_it_cannot_plan():
+    class UnhashableCallable:
+        __hash__ = None
+
+        def __call__(self):
+            pass
+
+    warm_dependency_caches(UnhashableCallable())  # Must not raise.
+
+
+def test_warm_dependency_caches_skips_scalar_models_it_cannot_build():
+    def fn(x=[1]):
+        pass
+
+    warm_dependency_caches(fn)  # Must not raise.
+
+
+def test_warm_dependency_caches_visits_shared_sub_dependencies_once():
+    def shared():
+        pass
+
+    def fn(_a=Depends(shared), _b=Depends(shared)):
+        pass
+
+    warm_dependency_caches(fn)  # Must not raise.
@@ -10,7 +10,7 @@ from src.event_processor.exceptions import (
     FilterError,
     InvocationError,
 )
-from src.event_processor.filters import Exists, Accept, Eq
+from src.event_processor.filters import Exists, Accept, Eq, And, Dyn
 
 MOD_PATH = "src.event_processor.event_processor"
 
@@ -164,6 +164,33 @@ def test_invoke_returns_the_processor_return_value(event_processor):
     assert result.returned_value is result_mock
 
 
+def test_invoke_dispatches_filters_that_only_implement_matches(event_processor):
+    class DuckFilter:
+        def matches(self, event):
+            return "a" in event
+
+    result_mock = Mock()
+    event_processor.processors[DuckFilter(), 0] = [lambda: result_mock]
+
+    result = event_processor.invoke({"a": 0})
+
+    assert result.returned_value is result_mock
+
+
+def test_invoke_supports_unhashable_processors(event_processor):
+    class UnhashableProcessor:
+        __hash__ = None
+
+        def __call__(self):
+            return "value"
+
+    event_processor.processors[Accept(), 0] = [UnhashableProcessor()]
+
+    result = event_processor.invoke({})
+
+    assert result.returned_value == "value"
+
+
 def test_invoke_injects_event_into_processor(event_processor):
     event = {"a": 0}
     received_event = False
@@ -232,6 +259,61 @@ def test_invoke_calls_negative_rank_as_fallback(event_processor):
     assert called_b is False
 
 
+def test_invoke_does_not_evaluate_filters_below_the_winning_rank(event_processor):
+    class CountingAccept(Accept):
+        def __init__(self):
+            self.calls = 0
+
+        def _matches(self, event, path_cache):
+            self.calls += 1
+            return True
+
+    low_rank_filter = CountingAccept()
+    event_processor.processors[low_rank_filter, 0] = [lambda: "low"]
+
+    @event_processor.processor(Accept(), rank=1)
+    def fn():
+        return "high"
+
+    result = event_processor.invoke({})
+
+    assert result.returned_value == "high"
+    assert low_rank_filter.calls == 0
+
+
+def test_invoke_skips_matching_for_filters_whose_required_keys_are_absent(event_processor):
+    class CountingExists(Exists):
+        def __init__(self, path):
+            super().__init__(path)
+            self.calls = 0
+
+        def _matches(self, event, path_cache):
+            self.calls += 1
+            return super()._matches(event, path_cache)
+
+    counting_filter = CountingExists("a")
+    event_processor.processors[counting_filter, 0] = [lambda: "a"]
+
+    @event_processor.processor(Accept())
+    def fn():
+        return "default"
+
+    result = event_processor.invoke({"b": 0})
+
+    assert result.returned_value == "default"
+    assert counting_filter.calls == 0
+
+
+def test_invoke_matches_filters_whose_required_keys_are_injected_during_matching(event_processor):
+    @event_processor.processor(And(Dyn(lambda e: "v", inject_as="a"), Eq("a", "v")))
+    def fn():
+        return "matched"
+
+    result = event_processor.invoke({})
+
+    assert result.returned_value == "matched"
+
+
 def test_invoke_result_contains_processor_names():
     event_processor = EventProcessor(InvocationStrategies.ALL_MATCHES)
 
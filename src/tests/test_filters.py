@@ -100,6 +100,27 @@ def test_exists_filter_does_not_match_empty_event():
     assert result is False
 
 
+def test_exists_filter_matches_with_a_custom_path_type():
+    class DottedPath:
+        def split(self, _separator):
+            return ["a"]
+
+    test_filter = Exists(DottedPath())
+
+    assert test_filter.matches({"a": 0}) is True
+
+
+def test_exists_filter_subclass_overriding_only_matches_is_dispatched_through_it():
+    class InvertedExists(Exists):
+        def matches(self, event):
+            return not super().matches(event)
+
+    test_filter = And(InvertedExists("a"))
+
+    assert test_filter.matches({}) is True
+    assert test_filter.matches({"a": 0}) is False
+
+
 def test_exists_filter_is_equal_to_other_exists_filter_with_the_same_path():
     a_filter = Exists("a")
     b_filter = Exists("a")
@@ -533,6 +554,18 @@ def test_and_filter_matches_when_all_nested_filters_match():
     assert result is True
 
 
+def test_and_filter_accepts_sub_filters_that_only_implement_matches():
+    class DuckFilter:
+        def __init__(self, result):
+            self.result = result
+
+        def matches(self, _event):
+            return self.result
+
+    assert And(DuckFilter(True), Exists("a")).matches({"a": 0}) is True
+    assert And(DuckFilter(False)).matches({}) is False
+
+
 def test_and_filter_does_not_match_when_one_filter_does_not_match():
     test_filter = And(Exists("a"), Exists("b"))
 
@@ -564,6 +597,12 @@ def test_and_filter_is_equal_when_sub_filters_are_equal():
     assert and_filter_1 == and_filter_2
 
 
+def test_and_filter_is_equal_to_itself():
+    test_filter = And(Exists("a"), Exists("b"))
+
+    assert test_filter == test_filter
+
+
 def test_and_filter_is_not_equal_when_sub_filters_are_different():
     a_filter = Mock()
     a_filter.__eq__ = lambda _, x: x is a_filter
@@ -578,6 +617,16 @@ def test_and_filter_is_not_equal_when_sub_filters_are_different():
     assert and_filter_2 != and_filter_3
 
 
+def test_and_filter_is_equal_when_nested_sub_filters_are_reordered():
+    a_filter = Exists("a")
+    b_filter = Exists("b")
+
+    or_filter_1 = Or(And(a_filter, b_filter))
+    or_filter_2 = Or(And(b_filter, a_filter))
+
+    assert or_filter_1 == or_filter_2
+
+
 def test_and_filter_is_not_equal_when_other_is_not_a_filter():
     a_filter = And(Mock())
 
@@ -609,6 +658,18 @@ def test_or_filter_matches_when_one_nested_filter_matches():
     assert result is True
 
 
+def test_or_filter_accepts_sub_filters_that_only_implement_matches():
+    class DuckFilter:
+        def __init__(self, result):
+            self.result = result
+
+        def matches(self, _event):
+            return self.result
+
+    assert Or(DuckFilter(False), Exists("a")).matches({"a": 0}) is True
+    assert Or(DuckFilter(False)).matches({}) is False
+
+
 def test_or_filter_does_not_match_when_no_filters_match():
     test_filter = Or(Exists("a"), Eq("x", "y"))
 
@@ -617,6 +678,22 @@ def test_or_filter_does_not_match_when_no_filters_match():
     assert result is False
 
 
+def test_or_filter_re_reads_paths_after_a_dyn_sub_filter_injects_a_key():
+    test_filter = Or(Exists("key"), And(Dyn(lambda e: "v", inject_as="key"), Eq("key", "v")))
+
+    result = test_filter.matches({})
+
+    assert result is True
+
+
+def test_or_filter_shares_cached_path_misses_between_sub_filters():
+    test_filter = Or(Exists("a"), Eq("a", 0))
+
+    result = test_filter.matches({})
+
+    assert result is False
+
+
 def test_or_filter_is_short_circuiting_when_one_filter_matches():
     test_filter = Or(Exists("a"), Exists("b"), Dyn(lambda e: e["nonexistent"]))
     test_filter_shorthand = Exists("a") | Exists("b") | Dyn(lambda e: e["nonexistent"])
@@ -640,6 +717,12 @@ def test_or_filter_is_equal_when_sub_filters_are_equal():
     assert or_filter_1 == or_filter_2
 
 
+def test_or_filter_is_equal_to_itself():
+    test_filter = Or(Exists("a"), Exists("b"))
+
+    assert test_filter == test_filter
+
+
 def test_or_filter_is_not_equal_when_sub_filters_are_different():
     a_filter = Mock()
     a_filter.__eq__ = lambda _, x: x is a_filter
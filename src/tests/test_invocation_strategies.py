@@ -4,6 +4,7 @@ import pytest
 
 from src.event_processor.exceptions import InvocationError
 from src.event_processor.invocation_strategies import FirstMatch, AllMatches, NoMatches, NoMatchesStrict
+from src.event_processor.invocation_strategies import _get_processor_name
 
 
 def test_first_match_invokes_first_matching_processor():
@@ -114,3 +115,19 @@ def test_no_matches_strict_returns_the_processor_name_on_a_single_match():
     result = NoMatchesStrict().invoke([processor_a])
 
     assert result.processor_name == "processor_a"
+
+
+def test_get_processor_name_looks_up_unhashable_processors_without_the_cache():
+    class UnhashableProcessor:
+        __hash__ = None
+
+        def __call__(self):
+            pass
+
+    processor = UnhashableProcessor()
+
+    assert _get_processor_name(processor) == "unavailable"
+
+    processor.__name__ = "processor"
+
+    assert _get_processor_name(processor) == "processor"